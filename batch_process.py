@@ -6,9 +6,13 @@ This script demonstrates how to process a large collection of PDFs
 and perform analysis on the results.
 """
 
+import argparse
+import itertools
 import os
 import sys
 import logging
+import logging.handlers
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List
 
@@ -17,7 +21,8 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from lit_review.utils.config import Config
-from lit_review.cli import process_directory, initialize_database, show_statistics
+from lit_review.cli import (_init_worker, _process_pdf_in_worker,
+                            initialize_database, show_statistics)
 from lit_review.storage.document_storage import DocumentStorage
 from lit_review.analysis.citation_analyzer import CitationAnalyzer
 from lit_review.analysis.coauthorship_analyzer import CoAuthorshipAnalyzer
@@ -25,60 +30,111 @@ from lit_review.analysis.coauthorship_analyzer import CoAuthorshipAnalyzer
 
 def setup_logging():
     """Configure logging for batch processing"""
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+    # Buffer file writes through a MemoryHandler so long runs flush INFO
+    # records in bulk instead of hitting the file per log call. flush()
+    # formats via the target, so the formatter must be set there —
+    # basicConfig only reaches the MemoryHandler itself
+    file_target = logging.FileHandler('batch_processing.log', delay=True)
+    file_target.setFormatter(logging.Formatter(log_format))
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=1000,
+        flushLevel=logging.ERROR,
+        target=file_target
+    )
+
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler('batch_processing.log')
+            file_handler
         ]
     )
 
 
+def parse_args():
+    """Parse command-line arguments for non-interactive batch runs"""
+    parser = argparse.ArgumentParser(
+        description='Batch process a mathematics education PDF collection')
+    parser.add_argument('--pdf-dir', required=True,
+                        help='Directory containing the PDF collection')
+    parser.add_argument('--max-files', type=int,
+                        help='Maximum number of files to process')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: MAX_WORKERS config)')
+    parser.add_argument('--no-docling', action='store_true',
+                        help='Use fallback processor instead of docling')
+    return parser.parse_args()
+
+
 def main():
     """Main batch processing workflow"""
+    args = parse_args()
     setup_logging()
     logger = logging.getLogger(__name__)
-    
+
     # Configuration
     config = Config()
-    
+
     logger.info("Starting batch processing for mathematics education literature collection")
-    
+
     # Step 1: Initialize database if needed
     logger.info("Initializing database...")
     initialize_database(config)
-    
+
     # Step 2: Check if we have PDFs to process
-    pdf_directory = input("Enter the path to your PDF collection: ").strip()
+    pdf_directory = args.pdf_dir
     if not os.path.exists(pdf_directory):
         logger.error(f"Directory not found: {pdf_directory}")
         return
-    
-    pdf_files = list(Path(pdf_directory).glob('**/*.pdf'))
-    logger.info(f"Found {len(pdf_files)} PDF files to process")
-    
-    if len(pdf_files) == 0:
-        logger.warning("No PDF files found in the specified directory")
-        return
-    
-    # Step 3: Process PDFs
-    max_files = input(f"Process all {len(pdf_files)} files? Enter max number or 'all': ").strip()
-    if max_files.lower() != 'all':
-        try:
-            max_files = int(max_files)
-        except ValueError:
-            max_files = None
-    else:
-        max_files = None
-    
-    logger.info("Starting PDF processing...")
-    try:
-        process_directory(pdf_directory, config, use_docling=True, max_files=max_files)
-    except Exception as e:
-        logger.error(f"Error during processing: {str(e)}")
-        logger.info("Trying with fallback processor...")
-        process_directory(pdf_directory, config, use_docling=False, max_files=max_files)
+
+    # Stream directory enumeration: counting up-front forces a full walk
+    # on large trees, so the cap is applied lazily with islice instead
+    pdf_iter = Path(pdf_directory).rglob('*.pdf')
+    if args.max_files:
+        pdf_iter = itertools.islice(pdf_iter, args.max_files)
+
+    # PDF processing is independent per file, so shard it across a process pool
+    workers = args.workers or config.max_workers
+    use_docling = not args.no_docling
+    logger.info(f"Starting PDF processing with {workers} workers "
+                f"(docling={'on' if use_docling else 'off'}, "
+                f"max_files={args.max_files or 'all'})...")
+    successful = 0
+    failed = 0
+
+    # Each worker builds its processor and storage once via the shared
+    # CLI initializer instead of reloading the embedding model per PDF
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(config, use_docling)) as executor:
+        futures = {executor.submit(_process_pdf_in_worker, str(pdf_file),
+                                   config, use_docling): pdf_file
+                   for pdf_file in pdf_iter}
+
+        if not futures:
+            logger.warning("No PDF files found in the specified directory")
+            return
+
+        for i, future in enumerate(as_completed(futures), 1):
+            pdf_file = futures[future]
+            try:
+                if future.result():
+                    successful += 1
+                else:
+                    failed += 1
+            except Exception as e:
+                failed += 1
+                logger.error(f"Error processing {pdf_file.name}: {str(e)}")
+
+            if i % 10 == 0:
+                logger.info(f"Progress: {i}/{len(futures)} files processed "
+                            f"({successful} successful, {failed} failed)")
+
+    logger.info(f"Processing complete. {successful} successful, {failed} failed "
+                f"out of {len(futures)} total files.")
     
     # Step 4: Show statistics
     logger.info("Processing complete. Generating statistics...")
@@ -104,40 +160,47 @@ def analyze_collection(config: Config):
         
         logger.info("Analyzing citation patterns...")
         citation_analysis = citation_analyzer.analyze_citation_patterns()
-        
-        logger.info("Citation Analysis Results:")
-        logger.info(f"  Total papers: {citation_analysis.get('total_papers', 0)}")
-        logger.info(f"  Total citations: {citation_analysis.get('total_citations', 0)}")
-        logger.info(f"  Average citations per paper: {citation_analysis.get('average_citations_per_paper', 0):.2f}")
-        
+
+        # Emit one log record per report section to keep handler traffic low
+        lines = [
+            "Citation Analysis Results:",
+            f"  Total papers: {citation_analysis.get('total_papers', 0)}",
+            f"  Total citations: {citation_analysis.get('total_citations', 0)}",
+            f"  Average citations per paper: {citation_analysis.get('average_citations_per_paper', 0):.2f}",
+        ]
+
         # Get most cited papers
         most_cited = citation_analyzer.get_most_cited_papers(5)
         if most_cited:
-            logger.info("Top 5 most cited papers:")
+            lines.append("Top 5 most cited papers:")
             for i, paper in enumerate(most_cited, 1):
-                logger.info(f"  {i}. {paper['document']['title']} ({paper['citation_count']} citations)")
-        
+                lines.append(f"  {i}. {paper['document']['title']} ({paper['citation_count']} citations)")
+        logger.info('\n'.join(lines))
+
         logger.info("Analyzing collaboration patterns...")
         collab_analysis = coauthorship_analyzer.analyze_author_centrality()
-        
-        logger.info("Collaboration Analysis Results:")
-        logger.info(f"  Total authors: {collab_analysis.get('total_authors', 0)}")
-        logger.info(f"  Total collaborations: {collab_analysis.get('total_collaborations', 0)}")
-        logger.info(f"  Average collaborators per author: {collab_analysis.get('average_collaborators_per_author', 0):.2f}")
-        
+
+        lines = [
+            "Collaboration Analysis Results:",
+            f"  Total authors: {collab_analysis.get('total_authors', 0)}",
+            f"  Total collaborations: {collab_analysis.get('total_collaborations', 0)}",
+            f"  Average collaborators per author: {collab_analysis.get('average_collaborators_per_author', 0):.2f}",
+        ]
+
         # Get most collaborative authors
         most_collaborative = coauthorship_analyzer.get_most_collaborative_authors(5)
         if most_collaborative:
-            logger.info("Top 5 most collaborative authors:")
+            lines.append("Top 5 most collaborative authors:")
             for i, author in enumerate(most_collaborative, 1):
-                logger.info(f"  {i}. {author['name']} ({author['unique_collaborators']} collaborators)")
-        
+                lines.append(f"  {i}. {author['name']} ({author['unique_collaborators']} collaborators)")
+
         # Find research communities
         communities = coauthorship_analyzer.find_research_communities()
         if communities:
-            logger.info(f"Found {len(communities)} research communities:")
+            lines.append(f"Found {len(communities)} research communities:")
             for i, community in enumerate(communities[:3], 1):
-                logger.info(f"  Community {i}: {community['size']} authors, {community['total_papers']} papers")
+                lines.append(f"  Community {i}: {community['size']} authors, {community['total_papers']} papers")
+        logger.info('\n'.join(lines))
         
     except Exception as e:
         logger.error(f"Error during analysis: {str(e)}")
@@ -0,0 +1,33 @@
+"""
+Numerical kernels for post-query citation analytics
+
+These operate on citation edges materialized as integer NumPy arrays.
+When Numba is installed the hot loops are JIT-compiled to native code;
+otherwise equivalent vectorized NumPy implementations are used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def degree_counts(src, dst, n):
+        """Count in- and out-degrees from edge arrays"""
+        in_deg = np.zeros(n, dtype=np.int64)
+        out_deg = np.zeros(n, dtype=np.int64)
+        for i in range(src.shape[0]):
+            out_deg[src[i]] += 1
+            in_deg[dst[i]] += 1
+        return in_deg, out_deg
+else:
+    def degree_counts(src, dst, n):
+        """Count in- and out-degrees from edge arrays"""
+        in_deg = np.bincount(dst, minlength=n)
+        out_deg = np.bincount(src, minlength=n)
+        return in_deg, out_deg
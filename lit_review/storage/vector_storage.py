@@ -3,6 +3,7 @@ Vector storage for semantic search using ChromaDB
 """
 
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import chromadb
 from chromadb.config import Settings
@@ -35,17 +36,47 @@ class VectorStorage:
         
         # Initialize embedding model
         self.embedding_model = SentenceTransformer(config.embedding_model)
+
+        # Per-instance LRU over query embeddings; repeated and paginated
+        # searches skip the transformer forward pass entirely
+        self._encode_query = lru_cache(maxsize=4096)(self._encode_query_uncached)
         
-        # Create collections
+        # Create collections; embeddings are normalized at encode time so
+        # inner-product distance is equivalent to cosine but cheaper
         self.documents_collection = self.client.get_or_create_collection(
             name="documents",
-            metadata={"description": "Document embeddings for semantic search"}
+            metadata={"description": "Document embeddings for semantic search",
+                      "hnsw:space": "ip"}
         )
-        
+
         self.sections_collection = self.client.get_or_create_collection(
-            name="sections", 
-            metadata={"description": "Document section embeddings"}
+            name="sections",
+            metadata={"description": "Document section embeddings",
+                      "hnsw:space": "ip"}
         )
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts in one normalized batch
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Array of embeddings, one row per text
+        """
+        # Normalizing at encode time keeps inner-product distance
+        # equivalent to cosine but cheaper. No int8 quantization: without
+        # fixed calibration ranges each call derives its own scale, so
+        # single-text encodes degenerate and stored vs query vectors
+        # stop being comparable
+        return self.embedding_model.encode(
+            texts, batch_size=64, convert_to_numpy=True,
+            normalize_embeddings=True, show_progress_bar=False)
+
+    def _encode_query_uncached(self, query: str) -> tuple:
+        """Embed a single query string; wrapped by an LRU in __init__"""
+        return tuple(self._encode([query])[0].tolist())
     
     def add_document(self, 
                     document_id: int,
@@ -64,15 +95,17 @@ class VectorStorage:
             metadata: Additional metadata
         """
         try:
-            # Prepare document text for embedding
+            # Prepare document text for embedding; title and abstract ride
+            # along in the batched add_document_sections call rather than
+            # paying their own encode passes here
             full_text = f"{title}\n\n{abstract}\n\n{content}"
-            
-            # Generate embedding
-            embedding = self.embedding_model.encode([full_text])[0].tolist()
-            
-            # Store in ChromaDB
+
+            embedding = self._encode([full_text])[0]
+
+            # Store in ChromaDB; the pinned chromadb validates embeddings
+            # as lists of Python floats, so convert the numpy row
             self.documents_collection.add(
-                embeddings=[embedding],
+                embeddings=[embedding.tolist()],
                 documents=[full_text],
                 metadatas=[{
                     'document_id': document_id,
@@ -82,34 +115,7 @@ class VectorStorage:
                 }],
                 ids=[f"doc_{document_id}"]
             )
-            
-            # Also add title and abstract separately for better granular search
-            if title:
-                title_embedding = self.embedding_model.encode([title])[0].tolist()
-                self.sections_collection.add(
-                    embeddings=[title_embedding],
-                    documents=[title],
-                    metadatas=[{
-                        'document_id': document_id,
-                        'section_type': 'title',
-                        'content': title
-                    }],
-                    ids=[f"doc_{document_id}_title"]
-                )
-            
-            if abstract:
-                abstract_embedding = self.embedding_model.encode([abstract])[0].tolist()
-                self.sections_collection.add(
-                    embeddings=[abstract_embedding],
-                    documents=[abstract],
-                    metadatas=[{
-                        'document_id': document_id,
-                        'section_type': 'abstract',
-                        'content': abstract[:1000]  # Store first 1000 chars
-                    }],
-                    ids=[f"doc_{document_id}_abstract"]
-                )
-            
+
             self.logger.info(f"Added document {document_id} to vector store")
             
         except Exception as e:
@@ -118,40 +124,61 @@ class VectorStorage:
     
     def add_document_sections(self,
                             document_id: int,
-                            sections: List[Dict[str, Any]]) -> None:
+                            sections: List[Dict[str, Any]],
+                            full_text: str = None) -> None:
         """
         Add document sections as separate embeddings
-        
+
         Args:
             document_id: Document ID
-            sections: List of section dictionaries with 'content', 'type', etc.
+            sections: List of section dictionaries with 'content' or
+                'start'/'end' character spans, 'type', etc.
+            full_text: Full document text to slice span-based sections from
         """
         try:
+            # Collect every non-empty section first so the model runs one
+            # batched forward pass instead of one call per section
+            contents = []
+            metadatas = []
+            ids = []
             for i, section in enumerate(sections):
-                if not section.get('content'):
+                content = section.get('content')
+                if not content and full_text is not None and 'start' in section:
+                    # Span-based sections reference the full text instead
+                    # of carrying their own copy of the page content
+                    content = full_text[section['start']:section['end']]
+                if not content:
                     continue
-                
-                content = section['content']
                 section_type = section.get('type', 'section')
-                
-                # Generate embedding
-                embedding = self.embedding_model.encode([content])[0].tolist()
-                
-                # Store in sections collection
+                contents.append(content)
+                metadata = {
+                    'document_id': document_id,
+                    'section_type': section_type,
+                    'section_index': i,
+                    'content': content[:1000]  # Store first 1000 chars in metadata
+                }
+                # Chroma rejects None metadata values, and title/abstract
+                # entries carry no page number
+                if section.get('page') is not None:
+                    metadata['page'] = section['page']
+                metadatas.append(metadata)
+                # Title/abstract keep their historical stable ids so
+                # re-ingesting a document overwrites rather than duplicates
+                if section_type in ('title', 'abstract'):
+                    ids.append(f"doc_{document_id}_{section_type}")
+                else:
+                    ids.append(f"doc_{document_id}_section_{i}")
+
+            if contents:
+                embeddings = self._encode(contents)
                 self.sections_collection.add(
-                    embeddings=[embedding],
-                    documents=[content],
-                    metadatas=[{
-                        'document_id': document_id,
-                        'section_type': section_type,
-                        'section_index': i,
-                        'page': section.get('page'),
-                        'content': content[:1000]  # Store first 1000 chars in metadata
-                    }],
-                    ids=[f"doc_{document_id}_section_{i}"]
+                    embeddings=embeddings.tolist(),
+                    documents=contents,
+                    metadatas=metadatas,
+                    ids=ids
                 )
-            
-            self.logger.info(f"Added {len(sections)} sections for document {document_id}")
+
+            self.logger.info(f"Added {len(contents)} sections for document {document_id}")
             
         except Exception as e:
             self.logger.error(f"Error adding sections for document {document_id}: {str(e)}")
@@ -175,8 +202,9 @@ class VectorStorage:
             List of search results
         """
         try:
-            # Generate query embedding
-            query_embedding = self.embedding_model.encode([query])[0].tolist()
+            # Generate query embedding via the same quantized path used
+            # at ingest so stored and query vectors stay comparable
+            query_embedding = list(self._encode_query(query))
             
             # Choose collection
             collection = self.sections_collection if search_sections else self.documents_collection
@@ -288,16 +316,10 @@ class VectorStorage:
         try:
             # Delete from documents collection
             self.documents_collection.delete(ids=[f"doc_{document_id}"])
-            
-            # Delete from sections collection (all sections for this document)
-            # First, find all sections for this document
-            sections_result = self.sections_collection.get(
-                where={'document_id': document_id},
-                include=['metadatas']
-            )
-            
-            if sections_result['ids']:
-                self.sections_collection.delete(ids=sections_result['ids'])
+
+            # Delete all sections for this document in one filtered call
+            # instead of fetching their ids first
+            self.sections_collection.delete(where={'document_id': document_id})
             
             self.logger.info(f"Deleted embeddings for document {document_id}")
             
@@ -315,7 +337,7 @@ class VectorStorage:
                 'documents_count': docs_count,
                 'sections_count': sections_count,
                 'embedding_model': self.config.embedding_model,
-                'embedding_dimension': len(self.embedding_model.encode(["test"])[0])
+                'embedding_dimension': self.embedding_model.get_sentence_embedding_dimension()
             }
             
         except Exception as e:
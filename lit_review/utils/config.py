@@ -3,6 +3,7 @@ Configuration management for the literature review platform
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict
 from dotenv import load_dotenv
@@ -26,61 +27,64 @@ class Config:
                 if os.path.exists(env_path):
                     load_dotenv(env_path)
                     break
-    
-    @property
+
+    # Settings are cached on first access; storage classes touch these on
+    # every operation and re-reading the environment each time adds a
+    # getenv + parse to every hot path
+    @cached_property
     def database_url(self) -> str:
         """Database connection URL"""
         return os.getenv('DATABASE_URL', 'sqlite:///lit_review.db')
     
-    @property
+    @cached_property
     def document_storage_path(self) -> Path:
         """Path for storing original documents"""
         path = os.getenv('DOCUMENT_STORAGE_PATH', './documents')
-        return Path(path).absolute()
+        return Path(path).resolve(strict=False)
     
-    @property
+    @cached_property
     def processed_storage_path(self) -> Path:
         """Path for storing processed documents"""
         path = os.getenv('PROCESSED_STORAGE_PATH', './processed')
-        return Path(path).absolute()
+        return Path(path).resolve(strict=False)
     
-    @property
+    @cached_property
     def vector_db_path(self) -> Path:
         """Path for vector database"""
         path = os.getenv('VECTOR_DB_PATH', './vector_db')
-        return Path(path).absolute()
+        return Path(path).resolve(strict=False)
     
-    @property
+    @cached_property
     def flask_host(self) -> str:
         """Flask host"""
         return os.getenv('FLASK_HOST', '0.0.0.0')
     
-    @property
+    @cached_property
     def flask_port(self) -> int:
         """Flask port"""
         return int(os.getenv('FLASK_PORT', 5000))
     
-    @property
+    @cached_property
     def flask_debug(self) -> bool:
         """Flask debug mode"""
         return os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     
-    @property
+    @cached_property
     def batch_size(self) -> int:
         """Batch size for processing"""
         return int(os.getenv('BATCH_SIZE', 10))
     
-    @property
+    @cached_property
     def max_workers(self) -> int:
         """Maximum number of worker processes"""
         return int(os.getenv('MAX_WORKERS', 4))
     
-    @property
+    @cached_property
     def embedding_model(self) -> str:
         """Sentence transformer model for embeddings"""
         return os.getenv('EMBEDDING_MODEL', 'all-MiniLM-L6-v2')
     
-    @property
+    @cached_property
     def spacy_model(self) -> str:
         """spaCy model for NLP"""
         return os.getenv('SPACY_MODEL', 'en_core_web_sm')
@@ -6,102 +6,183 @@ import re
 from typing import List, Dict, Any
 import logging
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def _compile(pattern: str, flags: int = 0):
+    """
+    Compile a pattern, preferring re2's linear-time engine when installed
+
+    re2 never backtracks, so pathological PDF-extracted text can't blow
+    up matching time; patterns using features it lacks (lookahead) fall
+    back to the stdlib engine.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+# All patterns are compiled once at import; the hot extraction paths run
+# per document and per reference line, and compiled Pattern objects skip
+# the re module's internal cache lookup on every call
+_WS_RE = _compile(r'\s+')
+
+# Non-printable characters the old per-character isprintable() loop
+# dropped: C0/C1 controls plus the format characters PDF extraction
+# leaves behind (soft hyphen, zero-width spaces/joiners, bidi controls,
+# invisible operators, BOM, interlinear annotation marks)
+_NONPRINTABLE = (r'\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f'
+                 r'\xad\u200b-\u200f\u202a-\u202e\u2060-\u206f'
+                 r'\ufeff\ufff9-\ufffb')
+
+# One pass over the text handles both jobs in clean_text: runs of
+# whitespace collapse to a single space and non-printable characters
+# are deleted, replacing the per-character isprintable() loop
+_CLEAN_RE = _compile(r'[' + _NONPRINTABLE + r']+|\s+')
+
+# Anything that would make clean_text do work: leading/trailing space,
+# a whitespace run, a non-space whitespace char, or a non-printable
+# character. Most strings are already clean, so one search that bails
+# at the first hit beats always substituting and re-allocating
+_NEEDS_CLEAN_RE = _compile(
+    r'^\s|\s$|\s\s|[^\S ]|[' + _NONPRINTABLE + r']')
+
+
+def _clean_repl(match) -> str:
+    """Replace whitespace runs with one space, drop control characters"""
+    return ' ' if match.group(0).isspace() else ''
+
+# Author lines like "John Smith, Jane Doe" or "J. Smith and J. Doe";
+# one alternation instead of three separate patterns so each candidate
+# line is scanned by a single engine pass
+_AUTHOR_LINE_RE = _compile(
+    r'^(?:[A-Z][a-z]+ [A-Z][a-z]+(?:,\s*[A-Z][a-z]+ [A-Z][a-z]+)*'
+    r'|[A-Z]\.\s*[A-Z][a-z]+(?:,\s*[A-Z]\.\s*[A-Z][a-z]+)*'
+    r'|[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+(?:,\s*[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+)*)$')
+_SPLIT_AUTHORS_RE = _compile(r',|\s+and\s+')
+
+_REFS_RE = _compile(
+    r'(?i)(?:references|bibliography|works\s+cited)\s*\n(.*?)(?=\n\s*(?:appendix|index|$))',
+    re.DOTALL)
+
+# Reference list entry markers ([1], 1., or an author surname pattern)
+# in one alternation so the block is scanned once instead of re-split
+# per marker style
+_REF_SEP_RE = _compile(r'\n\s*(?:\[\d+\]|\d+\.|[A-Z][a-z]+,\s*[A-Z])')
+
+# DOI, year and quoted title (straight, curly-single or curly-double
+# quotes) fused into one alternation so each citation is scanned once
+# instead of once per field
+_CIT_FIELD_RE = _compile(
+    r'(?:doi:)\s*(?P<doi>10\.\d+/\S+)'
+    r'|\b(?P<year>(?:19|20)\d{2})\b'
+    r'|"(?P<title_q>[^"]+)"'
+    r'|‘(?P<title_cs>[^’]+)’'
+    r'|[“”](?P<title_cd>[^“”"]+)[“”]',
+    re.IGNORECASE)
+
+_JOURNAL_RE = _compile(
+    r'\b([A-Z][a-zA-Z\s&]+(?:Journal|Review|Magazine|Quarterly|Annual))\b')
+
+# Author-year citations like (Smith, 2020) and numbered ones like [1]
+# fused into one alternation so the document is scanned once, not twice
+_CITE_RE = _compile(
+    r'\((?P<ay_auth>[A-Z][a-zA-Z]+(?:\s+(?:and|&)\s+[A-Z][a-zA-Z]+)*),'
+    r'\s*(?P<ay_year>\d{4})\)'
+    r'|\[(?P<num>\d+)\]')
+_SPLIT_AND_RE = _compile(r'\s+(?:and|&)\s+')
+
 
 def clean_text(text: str) -> str:
     """Clean and normalize text"""
     if not text:
         return ""
-    
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove non-printable characters
-    text = ''.join(char for char in text if char.isprintable() or char.isspace())
-    
-    return text.strip()
+
+    # Fast path: return already-clean strings untouched
+    if not _NEEDS_CLEAN_RE.search(text):
+        return text
+
+    # Collapse whitespace and strip control characters in one C-level pass
+    return _CLEAN_RE.sub(_clean_repl, text).strip()
 
 
 def extract_authors_from_text(text: str) -> List[str]:
     """
     Extract author names from document text
-    
+
     Args:
         text: Document text
-        
+
     Returns:
         List of author names
     """
     authors = []
-    
+
     # Look for author patterns after title
     lines = text.split('\n')[:20]  # Check first 20 lines
-    
+
     for i, line in enumerate(lines):
         line = line.strip()
-        
+
         # Skip very short or very long lines
         if len(line) < 5 or len(line) > 200:
             continue
-        
+
         # Check if line contains potential author names
-        # Look for patterns like "John Smith, Jane Doe" or "J. Smith and J. Doe"
-        author_patterns = [
-            r'^[A-Z][a-z]+ [A-Z][a-z]+(?:,\s*[A-Z][a-z]+ [A-Z][a-z]+)*$',
-            r'^[A-Z]\.\s*[A-Z][a-z]+(?:,\s*[A-Z]\.\s*[A-Z][a-z]+)*$',
-            r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+(?:,\s*[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+)*$',
-        ]
-        
-        for pattern in author_patterns:
-            if re.match(pattern, line):
-                # Split by comma and clean
-                author_list = [clean_text(author) for author in re.split(r',|\s+and\s+', line)]
-                authors.extend([author for author in author_list if author])
-                break
-    
-    return list(set(authors))  # Remove duplicates
+        if _AUTHOR_LINE_RE.match(line):
+            # Split by comma and clean
+            author_list = [clean_text(author) for author in _SPLIT_AUTHORS_RE.split(line)]
+            authors.extend([author for author in author_list if author])
+
+    # Remove duplicates while keeping first-seen order so output is stable
+    return list(dict.fromkeys(authors))
 
 
 def extract_citations(text: str) -> List[Dict[str, Any]]:
     """
     Extract citations from document text
-    
+
     Args:
         text: Document text
-        
+
     Returns:
         List of citation dictionaries
     """
     citations = []
-    
-    # Pattern for references section
-    references_pattern = r'(?i)(?:references|bibliography|works\s+cited)\s*\n(.*?)(?=\n\s*(?:appendix|index|$))'
-    
-    match = re.search(references_pattern, text, re.DOTALL)
+
+    match = _REFS_RE.search(text)
     if match:
         references_text = match.group(1)
-        
-        # Split references by common patterns
-        ref_patterns = [
-            r'\n\s*\[\d+\]',  # [1], [2], etc.
-            r'\n\s*\d+\.',    # 1., 2., etc.
-            r'\n\s*[A-Z][a-z]+,\s*[A-Z]',  # Author last name pattern
-        ]
-        
-        for pattern in ref_patterns:
-            refs = re.split(pattern, references_text)
-            if len(refs) > 3:  # If we found multiple references
-                for ref in refs[1:]:  # Skip first empty split
-                    ref = clean_text(ref)
-                    if len(ref) > 20:  # Minimum citation length
-                        citation = _parse_citation(ref)
-                        if citation:
-                            citations.append(citation)
-                break
-    
+
+        # Locate every entry marker in one scan and slice between them
+        separators = list(_REF_SEP_RE.finditer(references_text))
+        if len(separators) >= 3:  # If we found multiple references
+            for i, sep in enumerate(separators):
+                end = (separators[i + 1].start()
+                       if i + 1 < len(separators) else len(references_text))
+                ref = clean_text(references_text[sep.end():end])
+                if len(ref) > 20:  # Minimum citation length
+                    citation = _parse_citation(ref)
+                    if citation:
+                        citations.append(citation)
+
     # Also look for in-text citations
     in_text_citations = _extract_in_text_citations(text)
     citations.extend(in_text_citations)
-    
+
     return citations
 
 
@@ -115,120 +196,118 @@ def _parse_citation(citation_text: str) -> Dict[str, Any]:
         'journal': '',
         'doi': ''
     }
-    
-    # Extract DOI
-    doi_pattern = r'(?:doi:|DOI:)\s*(10\.\d+/[^\s]+)'
-    doi_match = re.search(doi_pattern, citation_text, re.IGNORECASE)
-    if doi_match:
-        citation['doi'] = doi_match.group(1)
-    
-    # Extract year
-    year_pattern = r'\b(19|20)\d{2}\b'
-    year_matches = re.findall(year_pattern, citation_text)
-    if year_matches:
-        citation['year'] = int(year_matches[0] + year_matches[0][2:])
-    
-    # Extract title (often in quotes or italics)
-    title_patterns = [
-        r'"([^"]+)"',
-        r''([^']+)'',
-        r'["""]([^"""]+)["""]'
-    ]
-    
-    for pattern in title_patterns:
-        title_match = re.search(pattern, citation_text)
-        if title_match:
-            citation['title'] = clean_text(title_match.group(1))
+
+    # One pass fills DOI, year and quoted title; each field keeps its
+    # first occurrence and the scan stops once all three are found
+    title_end = None
+    for match in _CIT_FIELD_RE.finditer(citation_text):
+        group = match.lastgroup
+        if group == 'doi':
+            if not citation['doi']:
+                citation['doi'] = match.group('doi')
+        elif group == 'year':
+            if citation['year'] is None:
+                citation['year'] = int(match.group('year'))
+        elif not citation['title']:
+            citation['title'] = clean_text(match.group(group))
+            title_end = match.end()
+        if citation['doi'] and citation['year'] is not None and citation['title']:
             break
-    
-    # Extract journal name (often after title, before year)
-    if citation['title']:
-        # Remove title from text for journal extraction
-        text_without_title = citation_text.replace(citation['title'], '')
-        # Look for italicized text or text patterns that could be journal names
-        journal_pattern = r'\b([A-Z][a-zA-Z\s&]+(?:Journal|Review|Magazine|Quarterly|Annual))\b'
-        journal_match = re.search(journal_pattern, text_without_title)
+
+    # Extract journal name (often after title, before year); resume the
+    # search at the title's end offset instead of copying the string with
+    # the title spliced out
+    if title_end is not None:
+        journal_match = _JOURNAL_RE.search(citation_text, title_end)
         if journal_match:
             citation['journal'] = clean_text(journal_match.group(1))
-    
+
     return citation
 
 
 def _extract_in_text_citations(text: str) -> List[Dict[str, Any]]:
     """Extract in-text citations like (Smith, 2020) or [1]"""
     citations = []
-    
-    # Pattern for author-year citations
-    author_year_pattern = r'\(([A-Z][a-zA-Z]+(?:\s+(?:and|&)\s+[A-Z][a-zA-Z]+)*),\s*(\d{4})\)'
-    
-    for match in re.finditer(author_year_pattern, text):
-        authors_text = match.group(1)
-        year = int(match.group(2))
-        
-        # Split authors
-        authors = re.split(r'\s+(?:and|&)\s+', authors_text)
-        
-        citation = {
-            'type': 'in_text',
-            'authors': [clean_text(author) for author in authors],
-            'year': year,
-            'text': match.group(0)
-        }
-        citations.append(citation)
-    
-    # Pattern for numbered citations
-    numbered_pattern = r'\[(\d+)\]'
-    
-    for match in re.finditer(numbered_pattern, text):
-        citation = {
-            'type': 'numbered',
-            'number': int(match.group(1)),
-            'text': match.group(0)
-        }
-        citations.append(citation)
-    
+
+    # Single pass picks up both citation styles in document order
+    for match in _CITE_RE.finditer(text):
+        if match.lastgroup == 'num':
+            citations.append({
+                'type': 'numbered',
+                'number': int(match.group('num')),
+                'text': match.group(0)
+            })
+        else:
+            authors = _SPLIT_AND_RE.split(match.group('ay_auth'))
+            citations.append({
+                'type': 'in_text',
+                'authors': [clean_text(author) for author in authors],
+                'year': int(match.group('ay_year')),
+                'text': match.group(0)
+            })
+
     return citations
 
 
 def extract_math_education_keywords(text: str) -> List[str]:
     """
     Extract mathematics education specific keywords
-    
+
     Args:
         text: Document text
-        
+
     Returns:
         List of relevant keywords
     """
-    # Mathematics education specific terms
-    math_ed_terms = [
-        'cognitively guided instruction', 'cgi', 'problem solving',
-        'mathematical reasoning', 'number sense', 'algebraic thinking',
-        'geometric reasoning', 'statistical literacy', 'mathematical modeling',
-        'conceptual understanding', 'procedural fluency', 'strategic competence',
-        'adaptive reasoning', 'productive disposition', 'mathematics anxiety',
-        'mathematics discourse', 'mathematical communication', 'representation',
-        'mathematical practices', 'inquiry-based learning', 'constructivism',
-        'sociocultural theory', 'zone of proximal development', 'scaffolding',
-        'differentiated instruction', 'formative assessment', 'summative assessment',
-        'mathematical proof', 'mathematical argumentation', 'visual mathematics',
-        'manipulatives', 'technology integration', 'calculator use',
-        'dynamic geometry', 'computer algebra systems', 'graphing calculators',
-        'fraction understanding', 'decimal concepts', 'rational numbers',
-        'proportional reasoning', 'functions', 'algebra', 'geometry',
-        'measurement', 'data analysis', 'probability', 'statistics',
-        'calculus', 'discrete mathematics', 'mathematical connections',
-        'problem-based learning', 'collaborative learning', 'peer tutoring',
-        'mathematics teacher education', 'professional development',
-        'mathematics curriculum', 'standards-based mathematics',
-        'common core', 'nctm standards', 'mathematical literacy'
-    ]
-    
-    found_keywords = []
+    if not text:
+        return []
+
+    found_keywords = set()
     text_lower = text.lower()
-    
-    for term in math_ed_terms:
-        if term.lower() in text_lower:
-            found_keywords.append(term)
-    
-    return found_keywords
\ No newline at end of file
+
+    if _KEYWORD_AUTOMATON is not None:
+        # One automaton pass matches every term simultaneously instead of
+        # scanning the full text once per term
+        for _, term in _KEYWORD_AUTOMATON.iter(text_lower):
+            found_keywords.add(term)
+    else:
+        for term in _MATH_ED_TERMS:
+            if term in text_lower:
+                found_keywords.add(term)
+
+    # Order by the term list so output is stable across runs and
+    # identical whether or not the automaton path was taken
+    return [term for term in _MATH_ED_TERMS if term in found_keywords]
+
+
+# Mathematics education specific terms matched by extract_math_education_keywords
+_MATH_ED_TERMS = [
+    'cognitively guided instruction', 'cgi', 'problem solving',
+    'mathematical reasoning', 'number sense', 'algebraic thinking',
+    'geometric reasoning', 'statistical literacy', 'mathematical modeling',
+    'conceptual understanding', 'procedural fluency', 'strategic competence',
+    'adaptive reasoning', 'productive disposition', 'mathematics anxiety',
+    'mathematics discourse', 'mathematical communication', 'representation',
+    'mathematical practices', 'inquiry-based learning', 'constructivism',
+    'sociocultural theory', 'zone of proximal development', 'scaffolding',
+    'differentiated instruction', 'formative assessment', 'summative assessment',
+    'mathematical proof', 'mathematical argumentation', 'visual mathematics',
+    'manipulatives', 'technology integration', 'calculator use',
+    'dynamic geometry', 'computer algebra systems', 'graphing calculators',
+    'fraction understanding', 'decimal concepts', 'rational numbers',
+    'proportional reasoning', 'functions', 'algebra', 'geometry',
+    'measurement', 'data analysis', 'probability', 'statistics',
+    'calculus', 'discrete mathematics', 'mathematical connections',
+    'problem-based learning', 'collaborative learning', 'peer tutoring',
+    'mathematics teacher education', 'professional development',
+    'mathematics curriculum', 'standards-based mathematics',
+    'common core', 'nctm standards', 'mathematical literacy'
+]
+
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _term in _MATH_ED_TERMS:
+        _KEYWORD_AUTOMATON.add_word(_term, _term)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
@@ -4,10 +4,36 @@ Flask web application for the literature review platform
 
 import os
 import logging
+import re
 from flask import Flask, request, jsonify, render_template, send_from_directory
 from flask_cors import CORS
 from typing import Dict, Any
 
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from flask_caching import Cache
+    FLASK_CACHING_AVAILABLE = True
+except ImportError:
+    FLASK_CACHING_AVAILABLE = False
+
+try:
+    from flask_compress import Compress
+    FLASK_COMPRESS_AVAILABLE = True
+except ImportError:
+    FLASK_COMPRESS_AVAILABLE = False
+
 from ..utils.config import Config
 from ..storage.document_storage import DocumentStorage
 from ..storage.vector_storage import VectorStorage
@@ -15,6 +41,52 @@ from ..analysis.citation_analyzer import CitationAnalyzer
 from ..analysis.coauthorship_analyzer import CoAuthorshipAnalyzer
 
 
+# Crude "First Last" name matcher used by the natural-language query
+# handler; compiled once rather than per request
+_NAMES_RE = re.compile(r'[A-Z][a-z]+ [A-Z][a-z]+')
+
+# Intent keywords for the natural-language query handler, matched in one
+# automaton pass over the query instead of a substring scan per keyword
+_INTENT_KEYWORDS = [
+    ('cognitively guided instruction', 'cgi'),
+    ('cgi', 'cgi'),
+    ('co-author', 'collab'),
+    ('collaborated', 'collab'),
+    ('cited by', 'citations'),
+    ('citations', 'citations'),
+    ('most cited', 'most_cited'),
+]
+
+if AHOCORASICK_AVAILABLE:
+    _INTENT_AUTOMATON = ahocorasick.Automaton()
+    for _kw, _tag in _INTENT_KEYWORDS:
+        _INTENT_AUTOMATON.add_word(_kw, _tag)
+    _INTENT_AUTOMATON.make_automaton()
+else:
+    _INTENT_AUTOMATON = None
+
+
+def _query_intents(query_lower: str) -> set:
+    """Return the set of intent tags present in a lowercased query"""
+    if _INTENT_AUTOMATON is not None:
+        return {tag for _, tag in _INTENT_AUTOMATON.iter(query_lower)}
+    return {tag for kw, tag in _INTENT_KEYWORDS if kw in query_lower}
+
+
+if ORJSON_AVAILABLE:
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider that serializes responses with orjson's C encoder"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(
+                obj,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+
 def create_app(config: Config = None) -> Flask:
     """
     Create Flask application
@@ -26,7 +98,12 @@ def create_app(config: Config = None) -> Flask:
         Flask application instance
     """
     app = Flask(__name__)
-    
+
+    # Serialize the large list endpoints (search, analysis) with orjson
+    # when available; jsonify picks the provider up transparently
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+
     # Initialize configuration
     if config is None:
         config = Config()
@@ -35,7 +112,26 @@ def create_app(config: Config = None) -> Flask:
     
     # Enable CORS
     CORS(app)
-    
+
+    # Compress the large JSON list responses (search, analysis) when
+    # flask-compress is installed; small payloads skip compression
+    if FLASK_COMPRESS_AVAILABLE:
+        app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+        app.config['COMPRESS_MIN_SIZE'] = 1024
+        Compress(app)
+
+    # Cache the heavy analysis endpoints for a few minutes; their results
+    # only change when new documents are ingested (which happens via the
+    # CLI, outside this process), so a short TTL is the invalidation
+    if FLASK_CACHING_AVAILABLE:
+        cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache',
+                                   'CACHE_DEFAULT_TIMEOUT': 300})
+        cached_analysis = cache.cached(query_string=True)
+    else:
+        def cached_analysis(view):
+            return view
+
+
     # Initialize storage and analysis components
     document_storage = DocumentStorage(config)
     vector_storage = VectorStorage(config)
@@ -83,17 +179,19 @@ def create_app(config: Config = None) -> Flask:
                 # Semantic search
                 results = vector_storage.semantic_search(query, n_results=limit)
                 
-                # Get full document details
+                # Resolve all hits with one IN query instead of a
+                # round-trip per result
+                doc_ids = [r['metadata'].get('document_id') for r in results]
+                id_to_doc = document_storage.get_documents_by_ids(
+                    [i for i in doc_ids if i])
                 documents = []
-                for result in results:
-                    doc_id = result['metadata'].get('document_id')
-                    if doc_id:
-                        doc = document_storage.get_document(doc_id)
-                        if doc:
-                            doc_dict = doc.to_dict()
-                            doc_dict['similarity_score'] = 1 - result.get('distance', 0)
-                            documents.append(doc_dict)
-                
+                for result, doc_id in zip(results, doc_ids):
+                    doc = id_to_doc.get(doc_id)
+                    if doc:
+                        doc_dict = doc.to_dict()
+                        doc_dict['similarity_score'] = 1 - result.get('distance', 0)
+                        documents.append(doc_dict)
+
                 return jsonify({
                     'documents': documents,
                     'total': len(documents),
@@ -156,6 +254,7 @@ def create_app(config: Config = None) -> Flask:
             return jsonify({'error': str(e)}), 500
     
     @app.route('/api/analysis/citations')
+    @cached_analysis
     def get_citation_analysis():
         """Get citation analysis"""
         try:
@@ -182,6 +281,7 @@ def create_app(config: Config = None) -> Flask:
             return jsonify({'error': str(e)}), 500
     
     @app.route('/api/analysis/collaboration')
+    @cached_analysis
     def get_collaboration_analysis():
         """Get co-authorship analysis"""
         try:
@@ -217,10 +317,10 @@ def create_app(config: Config = None) -> Flask:
             if not query:
                 return jsonify({'error': 'Query is required'}), 400
             
-            # Analyze query to determine intent
-            query_lower = query.lower()
-            
-            if 'cognitively guided instruction' in query_lower or 'cgi' in query_lower:
+            # Analyze query to determine intent with one keyword pass
+            intents = _query_intents(query.lower())
+
+            if 'cgi' in intents:
                 # Search for CGI-related papers
                 results = document_storage.search_documents(
                     query='cognitively guided instruction',
@@ -234,11 +334,10 @@ def create_app(config: Config = None) -> Flask:
                     'total': len(results)
                 })
             
-            elif 'co-author' in query_lower or 'collaborated' in query_lower:
+            elif 'collab' in intents:
                 # Extract author names and find collaborations
                 # Simple extraction - could be improved with NLP
-                import re
-                names = re.findall(r'[A-Z][a-z]+ [A-Z][a-z]+', query)
+                names = _NAMES_RE.findall(query)
                 
                 if names:
                     author_name = names[0]
@@ -250,9 +349,9 @@ def create_app(config: Config = None) -> Flask:
                         'results': profile
                     })
             
-            elif 'cited by' in query_lower or 'citations' in query_lower:
+            elif 'citations' in intents:
                 # Citation analysis query
-                if 'most cited' in query_lower:
+                if 'most_cited' in intents:
                     results = citation_analyzer.get_most_cited_papers(10)
                     
                     return jsonify({
@@ -264,16 +363,18 @@ def create_app(config: Config = None) -> Flask:
             # Default: semantic search
             results = vector_storage.semantic_search(query, n_results=10)
             
-            # Get full document details
+            # Resolve all hits with one IN query instead of a round-trip
+            # per result
+            doc_ids = [r['metadata'].get('document_id') for r in results]
+            id_to_doc = document_storage.get_documents_by_ids(
+                [i for i in doc_ids if i])
             documents = []
-            for result in results:
-                doc_id = result['metadata'].get('document_id')
-                if doc_id:
-                    doc = document_storage.get_document(doc_id)
-                    if doc:
-                        doc_dict = doc.to_dict()
-                        doc_dict['similarity_score'] = 1 - result.get('distance', 0)
-                        documents.append(doc_dict)
+            for result, doc_id in zip(results, doc_ids):
+                doc = id_to_doc.get(doc_id)
+                if doc:
+                    doc_dict = doc.to_dict()
+                    doc_dict['similarity_score'] = 1 - result.get('distance', 0)
+                    documents.append(doc_dict)
             
             return jsonify({
                 'query': query,